@@ -9,9 +9,11 @@ import copy
 
 
 class BacktrackingSearch:
-    def __init__(self, ac3=True, mrv=True, degree=True, lcv=True):
+    def __init__(self, ac3=True, mrv=True, degree=True, lcv=True, propagation=None):
         self.recursive_calls = 0  # keep track of recursive calls run runtime analysis
+        self.values_pruned = 0  # keep track of domain values removed by the propagation strategy
         self.ac3 = ac3
+        self.propagation = propagation  # PropagationStrategy to use instead of ac3 inference; None uses ac3 flag
         self.mrv = mrv
         self.degree = degree
         self.lcv = lcv
@@ -19,6 +21,13 @@ class BacktrackingSearch:
     def backtracking_search(self, csp):
         empty_assignment = [None] * csp.num_variables  # use array of integers to hold variable assignment
         domain = csp.domain  # a dictionary starting with keys = variables and values = all possible values
+
+        if self.propagation is not None:
+            # copy so pruning the starting domain doesn't change the csp
+            domain = copy.deepcopy(domain)
+            if not self.propagation.preprocess(self, csp, domain, empty_assignment):
+                return None
+
         return self.backtrack(empty_assignment, csp, domain)
 
     def backtrack(self, assignment, csp, domain):
@@ -40,7 +49,10 @@ class BacktrackingSearch:
                 self.update_domain(new_domain, csp.constraints, var, value)
 
                 # get inferences made by this new assignment
-                inferences = self.inference(csp, var, value, domain, assignment)
+                if self.propagation is not None:
+                    inferences = self.propagation.propagate(self, csp, var, value, new_domain, assignment)
+                else:
+                    inferences = self.inference(csp, var, value, domain, assignment)
 
                 if inferences is True:
                     # recurse into backtrack
@@ -0,0 +1,98 @@
+"""
+Date: 10/19/26
+Author: Tate Toussaint
+Description: times backtracking search with each propagation level so the best level can be chosen per problem family
+"""
+
+import math
+import time
+
+from BacktrackingSearch import BacktrackingSearch
+from PropagationStrategy import PropagationStrategy, ForwardChecking, MaintainingArcConsistency, SingletonArcConsistency
+
+
+# the built in propagation levels from cheapest to most pruning per node
+def default_propagation_levels():
+    return [PropagationStrategy(), ForwardChecking(), MaintainingArcConsistency(), SingletonArcConsistency(max_depth=1)]
+
+
+# solves each csp with each propagation level and records nodes, time, values pruned, and solutions found
+# the time is the best of repeats runs so a single slow run doesn't decide the level; a level whose run takes
+# longer than timeout seconds is marked as timed out and is not run again
+def benchmark_propagation(csps, propagation_levels=None, mrv=True, degree=True, lcv=True, repeats=5, timeout=None):
+    if propagation_levels is None:
+        propagation_levels = default_propagation_levels()
+
+    results = []  # one dictionary of measurements per propagation level, summed over the csps
+    for propagation in propagation_levels:
+        seconds = math.inf
+        timed_out = False
+        for _ in range(0, repeats):
+            # ac3 is ignored whenever a propagation strategy is given
+            search = BacktrackingSearch(mrv=mrv, degree=degree, lcv=lcv, propagation=propagation)
+            num_solved = 0  # csps with no solution still count as a completed search
+
+            start_time = time.perf_counter()
+            for csp in csps:
+                if search.backtracking_search(csp) is not None:
+                    num_solved += 1
+            run_seconds = time.perf_counter() - start_time
+            seconds = min(seconds, run_seconds)
+
+            if timeout is not None and run_seconds > timeout:
+                timed_out = True
+                break
+
+        # nodes and values pruned are the same every run so the last search's counts are used
+        results.append({"propagation": propagation,
+                        "timed_out": timed_out,
+                        "num_solved": num_solved,
+                        "num_csps": len(csps),
+                        "nodes": search.recursive_calls,
+                        "values_pruned": search.values_pruned,
+                        "seconds": seconds,
+                        "nodes_per_second": search.recursive_calls / seconds if seconds > 0 else 0})
+
+    return results
+
+
+# picks the level that finishes the family fastest, whether or not every csp has a solution; timed out levels are
+# skipped, levels within tie_margin of the fastest time count as a tie, and ties are broken by fewer nodes visited
+# and then by the earlier (cheaper) level in the list
+def choose_propagation(results, tie_margin=0.25):
+    fastest_seconds = math.inf
+    for result in results:
+        if not result["timed_out"]:
+            fastest_seconds = min(fastest_seconds, result["seconds"])
+
+    best_result = None
+    for result in results:
+        if result["timed_out"] or result["seconds"] > fastest_seconds * (1 + tie_margin):
+            continue
+        if best_result is None or result["nodes"] < best_result["nodes"]:
+            best_result = result
+
+    if best_result is None:
+        return None
+    return best_result["propagation"]
+
+
+def print_benchmark(results):
+    s = ""
+    for result in results:
+        s += result["propagation"].name.ljust(18)
+        s += "Nodes Visited: " + str(result["nodes"]).ljust(8)
+        s += "Values Pruned: " + str(result["values_pruned"]).ljust(8)
+        s += "Nodes/Second: " + str(round(result["nodes_per_second"])).ljust(8)
+        s += "Solved: " + (str(result["num_solved"]) + "/" + str(result["num_csps"])).ljust(8)
+        s += "Seconds: " + str(round(result["seconds"], 4))
+        if result["timed_out"]:
+            s += "  (Timed Out)"
+        s += "\n"
+
+    chosen = choose_propagation(results)
+    if chosen is None:
+        s += "Chosen Level: None"
+    else:
+        s += "Chosen Level: " + chosen.name
+    print(s)
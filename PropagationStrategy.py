@@ -0,0 +1,155 @@
+"""
+Date: 10/19/26
+Author: Tate Toussaint
+Description: propagation levels that backtracking search can plug in to prune variable domains after each assignment
+"""
+
+
+# strategies keep their own AC-3 that prunes the child's domain copy and never makes assignments; the ac3 flag of
+# BacktrackingSearch still runs its original arc_consistency and is ignored whenever a propagation strategy is given
+class PropagationStrategy:
+    name = "No Propagation"
+
+    # prunes the starting domain before search begins; returns False if the csp is unsolvable
+    def preprocess(self, search, csp, domain, assignment):
+        return True
+
+    # prunes domain after {var = value} is added to assignment; returns False if a domain is wiped out
+    def propagate(self, search, csp, var, value, domain, assignment):
+        return True
+
+    # removes values of x1 with no supporting value in x2; returns the number of values removed
+    def revise(self, csp, domain, x1, x2):
+        if (x1, x2) not in csp.constraints:
+            return 0
+
+        x1_x2_constraint = csp.constraints[(x1, x2)]
+        x2_domain = domain[x2]
+        new_x1_domain = set()
+        for val1 in domain[x1]:
+            for val2 in x2_domain:
+                if (val1, val2) in x1_x2_constraint:
+                    new_x1_domain.add(val1)
+                    break
+
+        removed = len(domain[x1]) - len(new_x1_domain)
+        if removed > 0:
+            domain[x1] = new_x1_domain  # replace instead of mutating since domain sets can be shared
+        return removed
+
+    # runs AC-3 starting from the arcs in queue; returns (consistent, number of values removed)
+    def arc_consistency(self, csp, domain, queue):
+        total_removed = 0
+        while len(queue) > 0:
+            x1, x2 = queue.pop(0)
+
+            removed = self.revise(csp, domain, x1, x2)
+            # check after every revise since a domain can already be empty before this arc removes anything
+            if len(domain[x1]) == 0:
+                return False, total_removed + removed
+            if removed > 0:
+                total_removed += removed
+                # domain of x1 changed so its other neighbors need to be checked again
+                for neighbor in csp.neighbor_map[x1]:
+                    if neighbor != x2:
+                        queue.append((neighbor, x1))
+
+        return True, total_removed
+
+    # returns the arcs pointing into var from its unassigned neighbors
+    def arcs_into(self, csp, var, assignment):
+        queue = []
+        for neighbor in csp.neighbor_map[var]:
+            if assignment[neighbor] is None:
+                queue.append((neighbor, var))
+        return queue
+
+
+class ForwardChecking(PropagationStrategy):
+    name = "Forward Checking"
+
+    # only checks the unassigned neighbors of the variable that was just assigned
+    def propagate(self, search, csp, var, value, domain, assignment):
+        for neighbor, _ in self.arcs_into(csp, var, assignment):
+            search.values_pruned += self.revise(csp, domain, neighbor, var)
+            if len(domain[neighbor]) == 0:
+                return False
+        return True
+
+
+class MaintainingArcConsistency(PropagationStrategy):
+    name = "MAC"
+
+    # runs AC-3 over the whole problem once before search
+    def preprocess(self, search, csp, domain, assignment):
+        consistent, removed = self.arc_consistency(csp, domain, list(csp.constraints))
+        search.values_pruned += removed
+        return consistent
+
+    # runs AC-3 seeded with the arcs into the variable that was just assigned
+    def propagate(self, search, csp, var, value, domain, assignment):
+        consistent, removed = self.arc_consistency(csp, domain, self.arcs_into(csp, var, assignment))
+        search.values_pruned += removed
+        return consistent
+
+
+class SingletonArcConsistency(MaintainingArcConsistency):
+    name = "SAC"
+
+    def __init__(self, max_depth=0):
+        self.max_depth = max_depth  # deepest level of the search tree that still runs SAC; MAC is used below it
+
+    # makes the starting domain singleton arc consistent
+    def preprocess(self, search, csp, domain, assignment):
+        if not MaintainingArcConsistency.preprocess(self, search, csp, domain, assignment):
+            return False
+        return self.singleton_arc_consistency(search, csp, domain, assignment)
+
+    # runs SAC at shallow depths where the extra pruning is worth the cost and MAC everywhere else
+    def propagate(self, search, csp, var, value, domain, assignment):
+        if not MaintainingArcConsistency.propagate(self, search, csp, var, value, domain, assignment):
+            return False
+
+        depth = 0
+        for assigned_value in assignment:
+            if assigned_value is not None:
+                depth += 1
+        if depth > self.max_depth:
+            return True
+        return self.singleton_arc_consistency(search, csp, domain, assignment)
+
+    # removes every value whose assignment alone makes the problem arc inconsistent; repeats until nothing changes
+    def singleton_arc_consistency(self, search, csp, domain, assignment):
+        changed = True
+        while changed:
+            changed = False
+            for var in range(0, len(assignment)):
+                if assignment[var] is not None:
+                    continue
+
+                supported_values = set()
+                for val in domain[var]:
+                    # try var = val on a copy; values are replaced rather than mutated so a shallow copy is enough
+                    trial_domain = dict(domain)
+                    trial_domain[var] = {val}
+                    consistent, _ = self.arc_consistency(csp, trial_domain, self.arcs_into(csp, var, assignment))
+                    if consistent:
+                        supported_values.add(val)
+
+                if len(supported_values) == 0:
+                    search.values_pruned += len(domain[var])
+                    return False
+
+                removed = len(domain[var]) - len(supported_values)
+                if removed > 0:
+                    search.values_pruned += removed
+                    domain[var] = supported_values
+
+                    # restore arc consistency after the removals before testing the next singleton
+                    consistent, removed = self.arc_consistency(csp, domain, self.arcs_into(csp, var, assignment))
+                    search.values_pruned += removed
+                    if not consistent:
+                        return False
+                    changed = True
+
+        return True
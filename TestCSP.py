@@ -7,6 +7,7 @@ Description: tests the CSP solver on various map problems and circuit board prob
 from BacktrackingSearch import BacktrackingSearch
 from MapColoringCSP import MapColoringCSP
 from CircuitBoardCSP import CircuitBoardCSP
+from PropagationBenchmark import benchmark_propagation, default_propagation_levels, print_benchmark
 
 
 '''MAP PROBLEM'''
@@ -124,3 +125,61 @@ circuit_backtracking_search_1 = BacktrackingSearch(mrv=True, degree=True, lcv=Tr
 cb_assignment = circuit_backtracking_search_1.backtracking_search(circuit_board_csp)
 circuit_board_csp.print_assignment(cb_assignment)
 print("Nodes Visited: " + str(circuit_backtracking_search_1.recursive_calls))
+
+
+
+'''PROPAGATION LEVELS'''
+print("\n                                                                         +========================+" +
+      "\n=========================================================================| Propagation Benchmarks |========================================================================="
+      "\n                                                                         +========================+")
+
+# returns True if the assignment is complete and satisfies every binary constraint of the csp
+def is_consistent_assignment(csp, assignment):
+    if assignment is None or None in assignment:
+        return False
+    for x1, x2 in csp.constraints:
+        if (assignment[x1], assignment[x2]) not in csp.constraints[(x1, x2)]:
+            return False
+    return True
+
+
+## Fresh CSPs so the ac3 tests above can't change the starting domains of the benchmarks
+propagation_map_csps = [MapColoringCSP(half_neighbors_australia, region_dictionary_australia, color_dictionary_australia),
+                        MapColoringCSP(half_neighbors_canada, region_dictionary_canada, color_dictionary_canada)]
+propagation_circuit_board_csp = CircuitBoardCSP(components, board_width, board_height)
+
+# four regions that all border each other can't be colored with three colors
+half_neighbors_k4 = {(0, 1), (0, 2), (0, 3), (1, 2), (1, 3), (2, 3)}
+region_dictionary_k4 = {0: "A", 1: "B", 2: "C", 3: "D"}
+propagation_k4_csp = MapColoringCSP(half_neighbors_k4, region_dictionary_k4, color_dictionary_australia)
+
+# no propagation, forward checking, MAC, and SAC (preprocessing + depth 1) with all heuristics on each problem family
+print("\n-----------------------------------------------------------------------TEST 0: Map Problems w/ all heuristics-----------------------------------------------------------------------")
+map_results = benchmark_propagation(propagation_map_csps)
+print_benchmark(map_results)
+
+print("\n-----------------------------------------------------------------------TEST 1: Circuit Board w/ all heuristics----------------------------------------------------------------------")
+circuit_results = benchmark_propagation([propagation_circuit_board_csp])
+print_benchmark(circuit_results)
+
+print("\n------------------------------------------------------------------TEST 2: Unsolvable K4 Map w/ all heuristics---------------------------------------------------------------------")
+k4_results = benchmark_propagation([propagation_k4_csp])
+print_benchmark(k4_results)
+
+print("\n------------------------------------------------------------------------TEST 3: Propagation Level Checks--------------------------------------------------------------------------")
+for propagation in default_propagation_levels():
+    propagation_search = BacktrackingSearch(propagation=propagation)
+
+    # every solvable problem returns a complete assignment that satisfies its constraints
+    for csp in propagation_map_csps + [propagation_circuit_board_csp]:
+        assert is_consistent_assignment(csp, propagation_search.backtracking_search(csp)), propagation.name
+
+    # the unsolvable map returns failure
+    assert propagation_search.backtracking_search(propagation_k4_csp) is None, propagation.name
+    print(propagation.name + ": consistent assignments + K4 failure")
+
+# stronger propagation never visits more nodes: no propagation >= forward checking >= MAC
+for results in [map_results, circuit_results, k4_results]:
+    assert results[0]["nodes"] >= results[1]["nodes"] >= results[2]["nodes"]
+print("Nodes Visited: No Propagation >= Forward Checking >= MAC")
+print("All propagation checks passed")